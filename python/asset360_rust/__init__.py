@@ -1,10 +1,12 @@
 """Python package for asset360-rust bindings."""
 
+import importlib
+
 # Import the native module built by Rust; we alias it to `_native` so
 # shims stay compatible with the dependency's layout.
 from . import _native2 as _native  # type: ignore
 from ._native2 import *  # noqa: F401,F403
-from ._resolver import resolve_schemas
+# Imported eagerly: it patches ``classes``/``slots`` onto the native SchemaView.
 from .schemaview import (
     ClassDefinition,
     ClassView,
@@ -16,10 +18,11 @@ from .schemaview import (
     SlotView,
     sum_as_string,
 )
-from .debug_utils import pretty_linkml_value
 
 # Build an explicit export list so type checkers don't flag the backing module.
-_native_exports = [name for name in dir(_native) if not name.startswith("_")]
+# PyO3 records every name added to the native module in its ``__all__`` (the
+# list ``import *`` above uses), so there is no need to filter ``dir()``.
+_native_exports = list(_native.__all__)
 
 __all__ = _native_exports + [
     "resolve_schemas",
@@ -34,3 +37,23 @@ __all__ = _native_exports + [
     "sum_as_string",
     "pretty_linkml_value",
 ]
+
+# Pure-Python helpers loaded on first access (PEP 562); ``_resolver`` pulls in
+# ``urllib.request``, which callers of the native API rarely need.
+_LAZY = {
+    "resolve_schemas": "._resolver",
+    "pretty_linkml_value": ".debug_utils",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -905,6 +905,14 @@ class ChangeStage:
     def to_json(self) -> dict: ...
     @staticmethod
     def from_json(schemaview:SchemaView, data:dict) -> ChangeStage: ...
+    @staticmethod
+    def bulk_from_payload(schemaview:SchemaView, class_id:builtins.str, payload:list) -> builtins.list[ChangeStage]:
+        r"""
+        Build every stage of a decoded stages payload in a single call.
+        
+        Each entry has the shape produced by `to_json` (its `class_id`, if any,
+        is ignored); every `value` is loaded as an instance of `class_id`.
+        """
     def __repr__(self) -> builtins.str: ...
 
 class ClassDefinition:
@@ -5789,7 +5797,13 @@ def get_all_classes_by_type_designator_and_schema(schemaview:asset360_rust.Schem
       tries both `"data.infrabel.be/asset360/managed"` and `"asset360/managed"`).
     """
 
-def get_blame_info(value:LinkMLInstance, blame_map:dict[int, asset360_rust.Asset360ChangeMeta]) -> typing.Optional[asset360_rust.Asset360ChangeMeta]: ...
+def get_blame_info(value:LinkMLInstance, blame_map:dict[int, asset360_rust.Asset360ChangeMeta]) -> typing.Optional[asset360_rust.Asset360ChangeMeta]:
+    r"""
+    Return the blame metadata recorded for `value`'s node, or `None`.
+    
+    `blame_map` maps node ids to `Asset360ChangeMeta` objects or their
+    `to_dict()` form; only the entry for `value` is read and validated.
+    """
 
 def get_foreign_references(instance:asset360_rust.LinkMLInstance, also_include_id_slots:builtins.bool=False) -> list[asset360_rust.ForeignReference]: ...
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+PYTHON_DIR = ROOT / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from asset360_rust import SchemaView  # noqa: E402  (import after path tweak)
+
+
+DATA_DIR = ROOT / "tests" / "data"
+
+SCHEMA_FILES = ("types.yaml", "rsm.yaml", "eulynx.yaml", "asset360.yaml")
+
+
+@pytest.fixture(scope="session")
+def schema_view() -> SchemaView:
+    """Asset360 SchemaView shared by the whole session; treat it as read-only."""
+    sv = SchemaView()
+    for name in SCHEMA_FILES:
+        sv.add_schema_from_path(str(DATA_DIR / name))
+    return sv
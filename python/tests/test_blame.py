@@ -1,19 +1,13 @@
 from __future__ import annotations
 
+import functools
 import json
-import sys
 import warnings
 from pathlib import Path
 
 import pytest
 
-
-ROOT = Path(__file__).resolve().parents[2]
-PYTHON_DIR = ROOT / "python"
-if str(PYTHON_DIR) not in sys.path:
-    sys.path.insert(0, str(PYTHON_DIR))
-
-from asset360_rust import (  # noqa: E402  (import after path tweak)
+from asset360_rust import (
     Asset360ChangeMeta,
     ChangeStage,
     Delta,
@@ -22,52 +16,33 @@ from asset360_rust import (  # noqa: E402  (import after path tweak)
 )
 
 
-def _load_instance(json_payload: str, sv: SchemaView, cv):
-    assert isinstance(json_payload, str), f"expected serialized JSON text, got {type(json_payload)}"
-    value, errors = load_json(json_payload, sv, cv)
-    for issue in errors:
-        warnings.warn(f"linkml validation issue: {issue}")
-    assert value is not None, "expected LinkMLInstance result"
-    return value
+@functools.lru_cache(maxsize=None)
+def _load_stages_payload() -> list[dict]:
+    # Shared between callers; do not mutate the returned payload.
+    stages_path = Path(__file__).parents[2] / "tests" / "data" / "asset360_stages.json"
+    return json.loads(stages_path.read_bytes())
 
 
-def _load_schema_view() -> SchemaView:
-    sv = SchemaView()
-    data_dir = ROOT / "tests" / "data"
-    for name in ["types.yaml", "rsm.yaml", "eulynx.yaml", "asset360.yaml"]:
-        sv.add_schema_from_path(str(data_dir / name))
-    return sv
+# ChangeStage objects are read-only from Python, so cached stages can be shared.
+# Keyed on id(sv), which is stable for the session-scoped ``schema_view`` fixture.
+_STAGES_CACHE: dict[tuple[int, str], list[ChangeStage]] = {}
 
 
 def _build_change_stages(sv: SchemaView, class_id: str) -> list[ChangeStage]:
-    cv = sv.get_class_view(class_id)
-    assert cv is not None, f"expected class '{class_id}' in schema"
-
-    stages_path = ROOT / "tests" / "data" / "asset360_stages.json"
-    stages_payload = json.loads(stages_path.read_text())
-
-    stages: list[ChangeStage] = []
-    for entry in stages_payload:
-        meta_dict = entry["meta"]
-        meta = Asset360ChangeMeta(
-            meta_dict["author"],
-            meta_dict["timestamp"],
-            meta_dict["source"],
-            meta_dict["change_id"],
-            meta_dict["ics_id"],
-        )
-        value = _load_instance(json.dumps(entry["value"]), sv, cv)
-        deltas = [
-            Delta(delta["path"], delta["op"], delta.get("old"), delta.get("new"))
-            for delta in entry.get("deltas", [])
-        ]
-        rejected_paths = entry.get("rejected_paths")
-        stages.append(ChangeStage(meta, value, deltas, rejected_paths))
-    return stages
-
-
-def test_change_stage_json_roundtrip() -> None:
-    sv = _load_schema_view()
+    cached = _STAGES_CACHE.get((id(sv), class_id))
+    if cached is not None:
+        return list(cached)
+
+    stages = ChangeStage.bulk_from_payload(sv, class_id, _load_stages_payload())
+    for stage in stages:
+        for issue in stage.value.validation_issues():
+            warnings.warn(f"linkml validation issue: {issue}")
+    _STAGES_CACHE[(id(sv), class_id)] = stages
+    return list(stages)
+
+
+def test_change_stage_json_roundtrip(schema_view: SchemaView) -> None:
+    sv = schema_view
     class_id = "https://data.infrabel.be/asset360/Signal"
     stages = _build_change_stages(sv, class_id)
     assert stages, "change stages fixture should not be empty"
@@ -86,6 +61,53 @@ def test_change_stage_json_roundtrip() -> None:
     assert reconstructed.value.equals(original.value)
 
 
+def test_change_stage_from_json_coerces_like_json_dumps(schema_view: SchemaView) -> None:
+    sv = schema_view
+    class_id = "https://data.infrabel.be/asset360/Signal"
+    payload = json.loads(json.dumps(_build_change_stages(sv, class_id)[0].to_json()))
+    delta = {
+        "path": ["id"],
+        "op": "update",
+        "old": {1: "a", 2.5: "b", False: "c", None: "d"},
+        "new": 2**70,
+    }
+    payload["deltas"] = [*payload["deltas"], delta]
+
+    reconstructed = ChangeStage.from_json(sv, payload)
+
+    encoded = reconstructed.to_json()["deltas"][-1]
+    expected = json.loads(json.dumps(delta))
+    assert encoded["old"] == expected["old"]
+    assert encoded["new"] == float(expected["new"])
+
+
+def test_bulk_from_payload_matches_constructor(schema_view: SchemaView) -> None:
+    sv = schema_view
+    class_id = "https://data.infrabel.be/asset360/Signal"
+    cv = sv.get_class_view(class_id)
+    stages = _build_change_stages(sv, class_id)
+    entry = _load_stages_payload()[-1]
+
+    meta_dict = entry["meta"]
+    meta = Asset360ChangeMeta(
+        meta_dict["author"],
+        meta_dict["timestamp"],
+        meta_dict["source"],
+        meta_dict["change_id"],
+        meta_dict["ics_id"],
+    )
+    value, _ = load_json(json.dumps(entry["value"]), sv, cv)
+    assert value is not None
+    deltas = [
+        Delta(delta["path"], delta["op"], delta.get("old"), delta.get("new"))
+        for delta in entry.get("deltas", [])
+    ]
+    expected = ChangeStage(meta, value, deltas, entry.get("rejected_paths"))
+
+    assert stages[-1].to_json() == expected.to_json()
+    assert stages[-1].value.equals(expected.value)
+
+
 def test_asset360_meta_json_error_message() -> None:
     meta = Asset360ChangeMeta("author", "ts", "source", 1, 2)
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-from importlib import import_module
 from pathlib import Path
 
 from asset360_rust import (
@@ -11,20 +10,19 @@ from asset360_rust import (
     blame_map_to_path_stage_map,
     compute_history,
     format_blame_map,
+    get_blame_info,
 )
 
-_test_blame = import_module("python.tests.test_blame")
-_load_schema_view = _test_blame._load_schema_view  # type: ignore[attr-defined]
-
 
 def _load_stage_fixture(sv, path: Path) -> list[ChangeStage]:
-    payload = json.loads(path.read_text())
+    payload = json.loads(path.read_bytes())
     return [ChangeStage.from_json(sv, entry) for entry in payload]
 
 
 def _normalize_stage_dict(data: dict) -> dict:
-    # Normalize through JSON to remove ordering differences and sort deltas/rejected paths
-    normalized = json.loads(json.dumps(data))
+    # Sort deltas/rejected paths so ordering differences don't matter; the sorts
+    # build new lists, so a shallow copy keeps ``data`` untouched.
+    normalized = dict(data)
     if "deltas" in normalized:
         normalized["deltas"] = sorted(
             normalized["deltas"],
@@ -37,12 +35,12 @@ def _normalize_stage_dict(data: dict) -> dict:
     return normalized
 
 
-def test_compute_history_matches_recomputed_fixture(tmp_path: Path) -> None:
-    sv = _load_schema_view()
+def test_compute_history_matches_recomputed_fixture(schema_view) -> None:
+    sv = schema_view
     base_dir = Path(__file__).resolve().parents[2] / "tests" / "data"
 
     stages = _load_stage_fixture(sv, base_dir / "stages.json")
-    expected = json.loads((base_dir / "recomputed_stages.json").read_text())
+    expected = json.loads((base_dir / "recomputed_stages.json").read_bytes())
 
     assert stages, "stages fixture should not be empty"
     assert len(stages) == len(expected)
@@ -62,9 +60,15 @@ def test_compute_history_matches_recomputed_fixture(tmp_path: Path) -> None:
     path_map = blame_map_to_path_stage_map(object_instance, blame_map)
     blame_text = format_blame_map(object_instance, blame_map)
 
-    output = tmp_path / "blame_dump.txt"
-    output.write_text(blame_text)
-
     assert path_map, "expected non-empty path map"
     assert all(isinstance(meta, Asset360ChangeMeta) for _, meta in path_map)
-    assert output.read_text() == blame_text
+    assert blame_text.strip(), "expected non-empty blame dump"
+
+    path, meta = path_map[0]
+    node = object_instance.navigate(path)
+    assert node is not None
+    from_native = get_blame_info(node, blame_map)
+    assert from_native is not None and from_native.to_dict() == meta.to_dict()
+    from_dict = get_blame_info(node, {node.node_id: meta.to_dict()})
+    assert from_dict is not None and from_dict.to_dict() == meta.to_dict()
+    assert get_blame_info(node, {}) is None
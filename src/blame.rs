@@ -127,17 +127,28 @@ pub fn format_blame_map(
     value: &LinkMLInstance,
     blame_map: &HashMap<NodeId, Asset360ChangeMeta>,
 ) -> String {
+    format_blame_map_with(value, blame_map, format_meta_column)
+}
+
+/// Render the fixed-width metadata column used by [`format_blame_map`].
+fn format_meta_column(meta: &Asset360ChangeMeta) -> String {
+    use std::fmt::Write;
+
     const META_COL_WIDTH: usize = 72;
-    format_blame_map_with(value, blame_map, |meta| {
-        let mut text = format!(
-            "cid={:>3} author={} ts={} src={} ics={}",
-            meta.change_id, meta.author, meta.timestamp, meta.source, meta.ics_id
-        );
-        if text.len() > META_COL_WIDTH {
-            text.truncate(META_COL_WIDTH);
-        }
-        format!("{text:<width$}", width = META_COL_WIDTH)
-    })
+    // Format, truncate and pad the column in a single buffer.
+    let mut text = String::with_capacity(META_COL_WIDTH);
+    let _ = write!(
+        text,
+        "cid={:>3} author={} ts={} src={} ics={}",
+        meta.change_id, meta.author, meta.timestamp, meta.source, meta.ics_id
+    );
+    // Cut on a char boundary; metadata may contain non-ASCII text.
+    if let Some((end, _)) = text.char_indices().nth(META_COL_WIDTH) {
+        text.truncate(end);
+    }
+    let pad = META_COL_WIDTH.saturating_sub(text.chars().count());
+    text.extend(std::iter::repeat_n(' ', pad));
+    text
 }
 
 pub use linkml_runtime::blame::get_blame_info;
@@ -146,28 +157,31 @@ pub use linkml_runtime::blame::get_blame_info;
 mod py_conversions {
     use super::Asset360ChangeMeta;
     use crate::PyAsset360ChangeMeta;
-    use pyo3::PyRef;
     use pyo3::exceptions::PyValueError;
+    use pyo3::intern;
     use pyo3::prelude::*;
-    use pyo3::types::PyDict;
+    use pyo3::types::{PyDict, PyString};
 
     impl<'py> FromPyObject<'py> for Asset360ChangeMeta {
         fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
-            if let Ok(meta_obj) = ob.extract::<PyRef<PyAsset360ChangeMeta>>() {
-                return Ok(meta_obj.clone_inner());
+            // Downcast rather than extract: a failed downcast doesn't build a PyErr,
+            // which matters for plain-dict metadata.
+            if let Ok(meta_obj) = ob.downcast::<PyAsset360ChangeMeta>() {
+                return Ok(meta_obj.try_borrow()?.clone_inner());
             }
 
+            let py = ob.py();
             let dict = ob.downcast::<PyDict>()?;
-            let require = |key: &str| {
+            let require = |key: &Bound<'py, PyString>| {
                 dict.get_item(key)?
                     .ok_or_else(|| PyValueError::new_err(format!("missing '{key}' in metadata")))
             };
             Ok(Asset360ChangeMeta {
-                author: require("author")?.extract()?,
-                timestamp: require("timestamp")?.extract()?,
-                source: require("source")?.extract()?,
-                change_id: require("change_id")?.extract()?,
-                ics_id: require("ics_id")?.extract()?,
+                author: require(intern!(py, "author"))?.extract()?,
+                timestamp: require(intern!(py, "timestamp"))?.extract()?,
+                source: require(intern!(py, "source"))?.extract()?,
+                change_id: require(intern!(py, "change_id"))?.extract()?,
+                ics_id: require(intern!(py, "ics_id"))?.extract()?,
             })
         }
     }
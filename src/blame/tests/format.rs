@@ -0,0 +1,37 @@
+use super::super::*;
+
+fn meta_with_author(author: &str) -> Asset360ChangeMeta {
+    Asset360ChangeMeta {
+        author: author.into(),
+        timestamp: "t1".into(),
+        source: "manual".into(),
+        change_id: 7,
+        ics_id: 101,
+    }
+}
+
+#[test]
+fn test_meta_column_pads_short_entries() {
+    let column = format_meta_column(&meta_with_author("a"));
+    let text = "cid=  7 author=a ts=t1 src=manual ics=101";
+    assert_eq!(column, format!("{text:<72}"));
+}
+
+#[test]
+fn test_meta_column_truncates_long_entries() {
+    let column = format_meta_column(&meta_with_author(&"x".repeat(100)));
+    assert_eq!(column.len(), 72);
+    assert_eq!(column, format!("cid=  7 author={}", "x".repeat(57)));
+}
+
+#[test]
+fn test_meta_column_counts_non_ascii_chars() {
+    let column = format_meta_column(&meta_with_author("Zoë"));
+    assert_eq!(column.chars().count(), 72);
+    assert!(column.starts_with("cid=  7 author=Zoë ts=t1 src=manual ics=101 "));
+
+    // Byte index 72 falls inside a two-byte char here.
+    let column = format_meta_column(&meta_with_author(&"é".repeat(100)));
+    assert_eq!(column.chars().count(), 72);
+    assert_eq!(column, format!("cid=  7 author={}", "é".repeat(57)));
+}
@@ -1,6 +1,7 @@
 mod asset360;
 mod basic;
 mod common;
+mod format;
 mod history;
 mod multi_stage;
 mod path_map;
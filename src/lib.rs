@@ -24,7 +24,9 @@ use linkml_schemaview::{Converter, identifier::Identifier, schemaview::SchemaVie
 #[cfg(feature = "python-bindings")]
 use pyo3::Bound;
 #[cfg(feature = "python-bindings")]
-use pyo3::types::{PyDict, PyModule};
+use pyo3::intern;
+#[cfg(feature = "python-bindings")]
+use pyo3::types::{PyDict, PyList, PyModule};
 
 #[cfg(feature = "python-bindings")]
 use crate::blame::{Asset360ChangeMeta, ChangeStage};
@@ -462,11 +464,11 @@ impl PyAsset360ChangeMeta {
 
     fn to_dict(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
         let dict = PyDict::new(py);
-        dict.set_item("author", &self.inner.author)?;
-        dict.set_item("timestamp", &self.inner.timestamp)?;
-        dict.set_item("source", &self.inner.source)?;
-        dict.set_item("change_id", self.inner.change_id)?;
-        dict.set_item("ics_id", self.inner.ics_id)?;
+        dict.set_item(intern!(py, "author"), &self.inner.author)?;
+        dict.set_item(intern!(py, "timestamp"), &self.inner.timestamp)?;
+        dict.set_item(intern!(py, "source"), &self.inner.source)?;
+        dict.set_item(intern!(py, "change_id"), self.inner.change_id)?;
+        dict.set_item(intern!(py, "ics_id"), self.inner.ics_id)?;
         Ok(dict.into())
     }
 }
@@ -567,31 +569,20 @@ impl PyChangeStage {
 
     fn to_json(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
         let dict = PyDict::new(py);
-        dict.set_item("class_id", &self.class_id)?;
+        dict.set_item(intern!(py, "class_id"), &self.class_id)?;
         dict.set_item(
-            "meta",
+            intern!(py, "meta"),
             PyAsset360ChangeMeta::from(self.inner.meta.clone()).to_dict(py)?,
         )?;
-        let json_mod = PyModule::import(py, "json")?;
-
         let value_json = self.inner.value.to_json();
-        let value_str = serde_json::to_string(&value_json).map_err(|e| {
-            pyo3::exceptions::PyValueError::new_err(format!(
-                "failed to encode LinkML value as JSON string: {e}"
-            ))
-        })?;
-        let value_py = json_mod.call_method1("loads", (value_str.as_str(),))?;
-        dict.set_item("value", value_py)?;
+        dict.set_item(intern!(py, "value"), json_value_to_py(py, &value_json)?)?;
 
-        let deltas_str = serde_json::to_string(&self.inner.deltas).map_err(|e| {
-            pyo3::exceptions::PyValueError::new_err(format!(
-                "failed to encode deltas as JSON string: {e}"
-            ))
+        let deltas_json = serde_json::to_value(&self.inner.deltas).map_err(|e| {
+            pyo3::exceptions::PyValueError::new_err(format!("failed to encode deltas: {e}"))
         })?;
-        let deltas_py = json_mod.call_method1("loads", (deltas_str.as_str(),))?;
-        dict.set_item("deltas", deltas_py)?;
+        dict.set_item(intern!(py, "deltas"), json_value_to_py(py, &deltas_json)?)?;
 
-        dict.set_item("rejected_paths", &self.inner.rejected_paths)?;
+        dict.set_item(intern!(py, "rejected_paths"), &self.inner.rejected_paths)?;
         Ok(dict.into())
     }
 
@@ -602,112 +593,61 @@ impl PyChangeStage {
         schemaview: Py<PySchemaView>,
         data: &Bound<'_, PyDict>,
     ) -> PyResult<Self> {
-        let json_mod = PyModule::import(py, "json")?;
-
-        let class_id_obj = data.get_item("class_id")?.ok_or_else(|| {
+        let class_id_obj = data.get_item(intern!(py, "class_id"))?.ok_or_else(|| {
             pyo3::exceptions::PyValueError::new_err("missing 'class_id' in ChangeStage JSON")
         })?;
         let class_id: String = class_id_obj.extract()?;
-        let meta_obj = data.get_item("meta")?.ok_or_else(|| {
-            pyo3::exceptions::PyValueError::new_err("missing 'meta' in ChangeStage JSON")
-        })?;
-        let meta = match meta_obj.extract::<PyAsset360ChangeMeta>() {
-            Ok(py_meta) => py_meta.clone_inner(),
-            Err(_) => {
-                let meta_str: String = json_mod
-                    .call_method1("dumps", (&meta_obj,))?
-                    .extract()
-                    .map_err(|e| {
-                        pyo3::exceptions::PyValueError::new_err(format!(
-                            "failed to serialize 'meta' payload: {e}"
-                        ))
-                    })?;
-                serde_json::from_str::<Asset360ChangeMeta>(&meta_str).map_err(|e| {
-                    pyo3::exceptions::PyValueError::new_err(format!("invalid 'meta' payload: {e}"))
-                })?
-            }
-        };
-
-        let value_obj = data.get_item("value")?.ok_or_else(|| {
-            pyo3::exceptions::PyValueError::new_err("missing 'value' in ChangeStage JSON")
-        })?;
-        let value_str: String = json_mod
-            .call_method1("dumps", (&value_obj,))?
-            .extract()
-            .map_err(|e| {
-                pyo3::exceptions::PyValueError::new_err(format!(
-                    "failed to serialize 'value' payload: {e}"
-                ))
-            })?;
-        let value_json: serde_json::Value = serde_json::from_str(&value_str).map_err(|e| {
-            pyo3::exceptions::PyValueError::new_err(format!("invalid 'value' payload: {e}"))
-        })?;
-
-        let deltas: Vec<Delta> = data
-            .get_item("deltas")?
-            .map(|obj| {
-                let deltas_str: String = json_mod
-                    .call_method1("dumps", (&obj,))?
-                    .extract()
-                    .map_err(|e| {
-                        pyo3::exceptions::PyValueError::new_err(format!(
-                            "failed to serialize 'deltas' payload: {e}"
-                        ))
-                    })?;
-                serde_json::from_str(&deltas_str).map_err(|e| {
-                    pyo3::exceptions::PyValueError::new_err(format!(
-                        "invalid 'deltas' payload: {e}"
-                    ))
-                })
-            })
-            .transpose()? // PyResult<Option<Vec<Delta>>>
-            .unwrap_or_default();
-
-        let rejected_paths = data
-            .get_item("rejected_paths")?
-            .map(|obj| obj.extract::<Vec<Vec<String>>>())
-            .transpose()?
-            .unwrap_or_default();
         let bound_sv = schemaview.bind(py);
         let borrowed_sv = bound_sv.borrow();
         let rust_sv = borrowed_sv.as_rust();
-        let conv = rust_sv.converter();
-        let class_view = rust_sv
-            .get_class(&Identifier::new(&class_id), &conv)
-            .map_err(|e| {
-                pyo3::exceptions::PyValueError::new_err(format!(
-                    "error resolving class '{class_id}': {:?}",
-                    e
-                ))
-            })?
-            .ok_or_else(|| {
-                pyo3::exceptions::PyValueError::new_err(format!(
-                    "class '{class_id}' not found in provided SchemaView"
-                ))
-            })?;
-        let value_str = serde_json::to_string(&value_json).map_err(|e| {
-            pyo3::exceptions::PyValueError::new_err(format!(
-                "failed to encode LinkML value as JSON string: {e}"
-            ))
-        })?;
-        let linkml_value = linkml_runtime::load_json_str(&value_str, rust_sv, &class_view, &conv)
-            .map_err(|e| {
-                pyo3::exceptions::PyValueError::new_err(format!("failed to load LinkML value: {e}"))
-            })?
-            .into_instance_tolerate_errors()?;
+        let class_view = Self::resolve_class(rust_sv, &class_id)?;
+        let inner = Self::stage_from_dict(py, rust_sv, &class_view, data)?;
 
         Ok(Self {
-            inner: ChangeStage {
-                meta,
-                value: linkml_value,
-                deltas,
-                rejected_paths,
-            },
+            inner,
             sv: schemaview.clone_ref(py),
             class_id,
         })
     }
 
+    /// Build every stage of a decoded stages payload in a single call.
+    ///
+    /// Each entry has the shape produced by `to_json` (its `class_id`, if any,
+    /// is ignored); every `value` is loaded as an instance of `class_id`.
+    #[staticmethod]
+    #[pyo3(signature = (schemaview, class_id, payload))]
+    fn bulk_from_payload(
+        py: Python<'_>,
+        schemaview: Py<PySchemaView>,
+        class_id: &str,
+        payload: &Bound<'_, PyList>,
+    ) -> PyResult<Vec<Py<PyChangeStage>>> {
+        let bound_sv = schemaview.bind(py);
+        let borrowed_sv = bound_sv.borrow();
+        let rust_sv = borrowed_sv.as_rust();
+        let conv = rust_sv.converter();
+        let rust_class = Self::resolve_class(rust_sv, class_id)?;
+
+        let mut stages = Vec::with_capacity(payload.len());
+        for entry in payload.iter() {
+            let entry = entry.downcast::<PyDict>()?;
+            let inner = Self::stage_from_dict(py, rust_sv, &rust_class, entry)?;
+            // Like `new`, report the class the value resolved to (e.g. a
+            // subclass picked by its type designator), not the requested one.
+            let stage_class_id = Self::value_class_identifier(&inner.value, &conv)
+                .unwrap_or_else(|| Self::class_identifier_from_view(&rust_class, &conv));
+            stages.push(Py::new(
+                py,
+                PyChangeStage {
+                    inner,
+                    sv: schemaview.clone_ref(py),
+                    class_id: stage_class_id,
+                },
+            )?);
+        }
+        Ok(stages)
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "ChangeStage(meta={}, deltas_len={}, rejected_paths_len={})",
@@ -724,6 +664,68 @@ impl PyChangeStage {
         self.inner.clone()
     }
 
+    fn resolve_class(sv: &SchemaView, class_id: &str) -> PyResult<ClassView> {
+        let conv = sv.converter();
+        sv.get_class(&Identifier::new(class_id), &conv)
+            .map_err(|e| {
+                pyo3::exceptions::PyValueError::new_err(format!(
+                    "error resolving class '{class_id}': {:?}",
+                    e
+                ))
+            })?
+            .ok_or_else(|| {
+                pyo3::exceptions::PyValueError::new_err(format!(
+                    "class '{class_id}' not found in provided SchemaView"
+                ))
+            })
+    }
+
+    /// Parse the `meta`, `value`, `deltas` and `rejected_paths` entries of a
+    /// `to_json`-shaped dict, loading `value` as an instance of `class_view`.
+    /// Missing or `None` `deltas`/`rejected_paths` default to empty.
+    fn stage_from_dict(
+        py: Python<'_>,
+        sv: &SchemaView,
+        class_view: &ClassView,
+        data: &Bound<'_, PyDict>,
+    ) -> PyResult<ChangeStage<Asset360ChangeMeta>> {
+        let meta_obj = data.get_item(intern!(py, "meta"))?.ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err("missing 'meta' in ChangeStage JSON")
+        })?;
+        let meta: Asset360ChangeMeta = meta_obj.extract().map_err(|e| {
+            pyo3::exceptions::PyValueError::new_err(format!("invalid 'meta' payload: {e}"))
+        })?;
+
+        let value_obj = data.get_item(intern!(py, "value"))?.ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err("missing 'value' in ChangeStage JSON")
+        })?;
+        let value = load_linkml_value(sv, class_view, &py_to_json_value(&value_obj)?)?;
+
+        let deltas: Vec<Delta> = match data.get_item(intern!(py, "deltas"))? {
+            Some(obj) if !obj.is_none() => serde_json::from_value(py_to_json_value(&obj)?)
+                .map_err(|e| {
+                    pyo3::exceptions::PyValueError::new_err(format!(
+                        "invalid 'deltas' payload: {e}"
+                    ))
+                })?,
+            _ => Vec::new(),
+        };
+
+        let rejected_paths = data
+            .get_item(intern!(py, "rejected_paths"))?
+            .map(|obj| obj.extract::<Option<Vec<Vec<String>>>>())
+            .transpose()?
+            .flatten()
+            .unwrap_or_default();
+
+        Ok(ChangeStage {
+            meta,
+            value,
+            deltas,
+            rejected_paths,
+        })
+    }
+
     fn class_identifier_from_view(class: &ClassView, conv: &Converter) -> String {
         match class.get_uri(conv, false, true) {
             Ok(identifier) => match identifier {
@@ -892,23 +894,196 @@ fn compute_history_py(
     Ok((py_value, py_history))
 }
 
+/// Convert an already-decoded JSON payload (dicts, lists and scalars) into a
+/// [`serde_json::Value`] without going through JSON text.
+///
+/// Accepts what `json.dumps` accepts and yields what parsing its output would:
+/// non-str dict keys are stringified and integers beyond 64 bits become floats.
+#[cfg(feature = "python-bindings")]
+fn py_to_json_value(obj: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
+    use pyo3::exceptions::{PyTypeError, PyValueError};
+    use pyo3::types::{PyBool, PyFloat, PyInt, PyString, PyTuple};
+    use serde_json::Value;
+
+    if obj.is_none() {
+        return Ok(Value::Null);
+    }
+    if let Ok(b) = obj.downcast::<PyBool>() {
+        return Ok(Value::Bool(b.is_true()));
+    }
+    if let Ok(i) = obj.downcast::<PyInt>() {
+        if let Ok(v) = i.extract::<i64>() {
+            return Ok(Value::from(v));
+        }
+        if let Ok(v) = i.extract::<u64>() {
+            return Ok(Value::from(v));
+        }
+        return i
+            .extract::<f64>()
+            .ok()
+            .and_then(serde_json::Number::from_f64)
+            .map(Value::Number)
+            .ok_or_else(|| PyValueError::new_err("integer out of range for a JSON number"));
+    }
+    if let Ok(f) = obj.downcast::<PyFloat>() {
+        let v = f.value();
+        return serde_json::Number::from_f64(v)
+            .map(Value::Number)
+            .ok_or_else(|| PyValueError::new_err(format!("cannot encode {v} as a JSON number")));
+    }
+    if let Ok(s) = obj.downcast::<PyString>() {
+        return Ok(Value::String(s.to_str()?.to_owned()));
+    }
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        let mut map = serde_json::Map::with_capacity(dict.len());
+        for (key, item) in dict.iter() {
+            map.insert(json_object_key(&key)?, py_to_json_value(&item)?);
+        }
+        return Ok(Value::Object(map));
+    }
+    if let Ok(list) = obj.downcast::<PyList>() {
+        return list
+            .iter()
+            .map(|item| py_to_json_value(&item))
+            .collect::<PyResult<Vec<_>>>()
+            .map(Value::Array);
+    }
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        return tuple
+            .iter()
+            .map(|item| py_to_json_value(&item))
+            .collect::<PyResult<Vec<_>>>()
+            .map(Value::Array);
+    }
+    Err(PyTypeError::new_err(format!(
+        "object of type '{}' is not JSON serializable",
+        obj.get_type().name()?
+    )))
+}
+
+/// Stringify a dict key the way `json.dumps` does.
+#[cfg(feature = "python-bindings")]
+fn json_object_key(key: &Bound<'_, PyAny>) -> PyResult<String> {
+    use pyo3::exceptions::PyTypeError;
+    use pyo3::types::{PyBool, PyFloat, PyInt, PyString};
+
+    let py = key.py();
+    if let Ok(s) = key.downcast::<PyString>() {
+        return Ok(s.to_str()?.to_owned());
+    }
+    if key.is_none() {
+        return Ok("null".to_owned());
+    }
+    if let Ok(b) = key.downcast::<PyBool>() {
+        return Ok(if b.is_true() { "true" } else { "false" }.to_owned());
+    }
+    if let Ok(f) = key.downcast::<PyFloat>() {
+        let v = f.value();
+        if v.is_nan() {
+            return Ok("NaN".to_owned());
+        }
+        if v.is_infinite() {
+            return Ok(if v > 0.0 { "Infinity" } else { "-Infinity" }.to_owned());
+        }
+        // Like `json.dumps`, bypass subclass overrides of `__repr__`.
+        return py
+            .get_type::<PyFloat>()
+            .call_method1(intern!(py, "__repr__"), (key,))?
+            .extract();
+    }
+    if key.downcast::<PyInt>().is_ok() {
+        return py
+            .get_type::<PyInt>()
+            .call_method1(intern!(py, "__repr__"), (key,))?
+            .extract();
+    }
+    Err(PyTypeError::new_err(format!(
+        "keys must be str, int, float, bool or None, not {}",
+        key.get_type().name()?
+    )))
+}
+
+/// Convert a [`serde_json::Value`] into the equivalent Python object, matching
+/// what `json.loads` would return for its JSON text.
+#[cfg(feature = "python-bindings")]
+fn json_value_to_py<'py>(
+    py: Python<'py>,
+    value: &serde_json::Value,
+) -> PyResult<Bound<'py, PyAny>> {
+    use pyo3::types::{PyBool, PyFloat, PyString};
+    use serde_json::Value;
+
+    Ok(match value {
+        Value::Null => py.None().into_bound(py),
+        Value::Bool(b) => PyBool::new(py, *b).to_owned().into_any(),
+        Value::Number(n) => match (n.as_i64(), n.as_u64()) {
+            (Some(i), _) => i.into_pyobject(py)?.into_any(),
+            (None, Some(u)) => u.into_pyobject(py)?.into_any(),
+            _ => PyFloat::new(py, n.as_f64().unwrap_or(f64::NAN)).into_any(),
+        },
+        Value::String(s) => PyString::new(py, s).into_any(),
+        Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_value_to_py(py, item)?)?;
+            }
+            list.into_any()
+        }
+        Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (key, item) in map {
+                dict.set_item(key, json_value_to_py(py, item)?)?;
+            }
+            dict.into_any()
+        }
+    })
+}
+
+/// Load a decoded JSON value as a `LinkMLInstance`.
+///
+/// The upstream loader only accepts JSON text, so the value is serialized once
+/// here; callers still skip Python's `json` module.
+#[cfg(feature = "python-bindings")]
+fn load_linkml_value(
+    sv: &SchemaView,
+    class_view: &ClassView,
+    value: &serde_json::Value,
+) -> PyResult<LinkMLInstance> {
+    let conv = sv.converter();
+    let value_str = serde_json::to_string(value).map_err(|e| {
+        pyo3::exceptions::PyValueError::new_err(format!(
+            "failed to encode LinkML value as JSON string: {e}"
+        ))
+    })?;
+    let instance = linkml_runtime::load_json_str(&value_str, sv, class_view, &conv)
+        .map_err(|e| {
+            pyo3::exceptions::PyValueError::new_err(format!("failed to load LinkML value: {e}"))
+        })?
+        .into_instance_tolerate_errors()?;
+    Ok(instance)
+}
+
+/// Look up the blame entry for `value` directly in the Python dict instead of
+/// converting the whole map; only that entry is extracted.
 #[cfg(feature = "python-bindings")]
 fn get_blame_info_py_impl(
     py: Python<'_>,
     value: Py<PyLinkMLInstance>,
-    blame_map: HashMap<NodeId, Asset360ChangeMeta>,
+    blame_map: &Bound<'_, PyDict>,
 ) -> PyResult<Option<Py<PyAsset360ChangeMeta>>> {
-    let bound = value.bind(py);
-    let borrowed = bound.borrow();
-
-    if let Some(meta) = crate::blame::get_blame_info(&borrowed.value, &blame_map) {
-        Ok(Some(Py::new(py, PyAsset360ChangeMeta::from(meta.clone()))?))
-    } else {
-        Ok(None)
-    }
+    let node_id: NodeId = value.bind(py).borrow().value.node_id();
+    let Some(entry) = blame_map.get_item(node_id)? else {
+        return Ok(None);
+    };
+    let meta: Asset360ChangeMeta = entry.extract()?;
+    Ok(Some(Py::new(py, PyAsset360ChangeMeta::from(meta))?))
 }
 
 #[cfg(all(feature = "python-bindings", feature = "stubgen"))]
+/// Return the blame metadata recorded for `value`'s node, or `None`.
+///
+/// `blame_map` maps node ids to `Asset360ChangeMeta` objects or their
+/// `to_dict()` form; only the entry for `value` is read and validated.
 #[gen_stub_pyfunction]
 #[gen_stub(
     override_return_type(
@@ -929,12 +1104,16 @@ fn get_blame_info_py(
             imports = ("typing", "asset360_rust")
         )
     )]
-    blame_map: HashMap<NodeId, Asset360ChangeMeta>,
+    blame_map: &Bound<'_, PyDict>,
 ) -> PyResult<Option<Py<PyAsset360ChangeMeta>>> {
     get_blame_info_py_impl(py, value, blame_map)
 }
 
 #[cfg(all(feature = "python-bindings", not(feature = "stubgen")))]
+/// Return the blame metadata recorded for `value`'s node, or `None`.
+///
+/// `blame_map` maps node ids to `Asset360ChangeMeta` objects or their
+/// `to_dict()` form; only the entry for `value` is read and validated.
 #[pyfunction(
     name = "get_blame_info",
     signature = (value, blame_map)
@@ -942,7 +1121,7 @@ fn get_blame_info_py(
 fn get_blame_info_py(
     py: Python<'_>,
     value: Py<PyLinkMLInstance>,
-    blame_map: HashMap<NodeId, Asset360ChangeMeta>,
+    blame_map: &Bound<'_, PyDict>,
 ) -> PyResult<Option<Py<PyAsset360ChangeMeta>>> {
     get_blame_info_py_impl(py, value, blame_map)
 }